@@ -1,10 +1,16 @@
 import streamlit as st
-import requests
-import json
 import os
+import gc
 from datetime import datetime
-import time
 import hashlib
+import sqlite3
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+# Collect the young generation less often; reruns allocate many short-lived objects
+gc.set_threshold(10000, 20, 20)
 
 # Page config
 st.set_page_config(
@@ -15,8 +21,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
+_CSS = """
     .stTabs [data-baseweb="tab-list"] button [data-testid="stMarkdownContainer"] p {
         font-size: 1.1rem;
     }
@@ -41,65 +46,211 @@ st.markdown("""
         margin-bottom: 10px;
         border-left: 4px solid #007bff;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit drops elements that are not re-emitted, so this runs on every rerun
+st.markdown(f"<style>\n{_CSS}</style>", unsafe_allow_html=True)
+
+# Jobs kept in the session and persistent (per user) histories
+SESSION_HISTORY_LEN = 20
+USER_HISTORY_LEN = 100
 
 # Initialize session state
 if 'api_token' not in st.session_state:
     st.session_state.api_token = None
 if 'job_history' not in st.session_state:
-    st.session_state.job_history = []
-if 'global_history' not in st.session_state:
-    st.session_state.global_history = {}  # Persists across logins
+    st.session_state.job_history = deque(maxlen=SESSION_HISTORY_LEN)
+if 'id_index' not in st.session_state:
+    st.session_state.id_index = {}  # job ID -> history entry
 if 'current_user_hash' not in st.session_state:
     st.session_state.current_user_hash = None
 if 'download_job_id' not in st.session_state:
     st.session_state.download_job_id = None
 if 'check_job_id' not in st.session_state:
     st.session_state.check_job_id = None
+if 'last_status' not in st.session_state:
+    st.session_state.last_status = None
+if 'last_status_token' not in st.session_state:
+    st.session_state.last_status_token = None  # token that fetched last_status
 
 # API Base URL
 API_BASE_URL = "https://transcribe-staging.api.inflexion.ai/enterprise"
 
+# SQLite file backing the persistent job history
+HISTORY_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.db")
+
+# Only this much of a transcript is decoded for the text preview
+PREVIEW_BYTES = 8 * 1024
+
+# Lookup tables
+MIME_TYPES = {
+    'mp3': 'audio/mpeg',
+    'mp4': 'audio/mp4'
+}
+
+STATUS_COLORS = {
+    "completed": "success",
+    "processing": "processing",
+    "failed": "failed"
+}
+
+# Export query flags and the checkbox each one comes from
+_EXPORT_FLAGS = (
+    ("remove_timestamps", "remove_timestamps"),
+    ("remove_word_level_timestamps", "remove_word_timestamps"),
+    ("remove_speaker_labels", "remove_speaker_labels"),
+    ("remove_insights", "remove_insights"),
+    ("remove_keywords", "remove_keywords"),
+)
+
+# Badge HTML for every known status, built once
+_STATUS_HTML = {
+    status: f'<span class="status-badge {css_class}">{status.upper()}</span>'
+    for status, css_class in STATUS_COLORS.items()
+}
+
 # Helper functions
+@st.cache_data(max_entries=32, show_spinner=False)
 def get_user_hash(token):
     """Create a hash of the API token for user identification"""
-    return hashlib.md5(token.encode()).hexdigest()[:16]
+    return hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
 
 def get_mime_type(filename):
     """Get MIME type based on file extension"""
     ext = filename.split('.')[-1].lower()
-    mime_types = {
-        'mp3': 'audio/mpeg',
-        'mp4': 'audio/mp4'
-    }
-    return mime_types.get(ext, 'audio/mpeg')
+    return MIME_TYPES.get(ext, 'audio/mpeg')
+
+@st.cache_resource
+def get_http_client():
+    """Shared HTTP session so connections are reused across reruns"""
+    # Imported here so visitors who never authenticate don't pay for the HTTP stack
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from http.cookiejar import DefaultCookiePolicy
+    
+    session = requests.Session()
+    # The session is shared by every user, so never keep cookies between requests
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            # Hand the last response back so callers can report its status code
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@st.cache_resource
+def get_db():
+    """Shared SQLite connection for the persistent job history"""
+    conn = sqlite3.connect(HISTORY_DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        "id TEXT PRIMARY KEY, user_hash TEXT NOT NULL, title TEXT, company TEXT, "
+        "submitted_at TEXT, status TEXT)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS jobs_user_submitted ON jobs (user_hash, submitted_at)")
+    conn.commit()
+    return conn
+
+@st.cache_resource
+def get_db_lock():
+    """Serializes access to the shared connection across sessions"""
+    return threading.Lock()
 
 def make_api_request(method, endpoint, headers=None, data=None, files=None):
     """Make API request with error handling"""
     url = f"{API_BASE_URL}{endpoint}"
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, data=data, files=files)
-        else:
+        if method not in ("GET", "POST"):
             raise ValueError(f"Unsupported method: {method}")
         
+        response = get_http_client().request(method, url, headers=headers, data=data, files=files)
         return response
     except Exception as e:
         st.error(f"API Request Error: {str(e)}")
         return None
 
+@st.cache_data(ttl=600, max_entries=50, show_spinner=False)
+def fetch_export(token, job_id, format_type, options):
+    """Download an exported transcript; completed transcripts are immutable, so results are cached.
+
+    Raises requests.HTTPError on non-200 responses so failures are never cached.
+    """
+    query_string = "?" + "&".join(f"{opt}=1" for opt in options) if options else ""
+    url = f"{API_BASE_URL}/transcript/export/{job_id}/{format_type}{query_string}"
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    response = get_http_client().get(url, headers=headers)
+    response.raise_for_status()
+    return response.content
+
+def make_upload_progress(progress_bar, total_bytes):
+    """Build a MultipartEncoderMonitor callback that advances progress_bar in whole percents"""
+    last_percent = -1
+    
+    def callback(monitor):
+        nonlocal last_percent
+        percent = min(100, monitor.bytes_read * 100 // max(total_bytes, 1))
+        # Only redraw when the visible value changes
+        if percent != last_percent:
+            last_percent = percent
+            progress_bar.progress(percent, text=f"Uploading... {percent}%")
+    
+    return callback
+
+def fetch_job_status(client, job_id, headers):
+    """Fetch a job's status without touching the UI (safe to call from worker threads)"""
+    import requests
+    
+    try:
+        response = client.get(f"{API_BASE_URL}/workflow/{job_id}", headers=headers)
+        if response.status_code != 200:
+            return None
+        status_data = response.json()
+    except (requests.RequestException, ValueError):
+        # Includes 200 responses whose body isn't JSON, e.g. a proxy error page
+        return None
+    if not isinstance(status_data, dict) or 'status' not in status_data:
+        return None
+    return status_data
+
+def refresh_all_statuses(job_ids, token):
+    """Fetch statuses for several jobs concurrently, keyed by job ID"""
+    headers = {"Authorization": f"Bearer {token}"}
+    # Resolve the cached session here; worker threads have no script run context
+    client = get_http_client()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(lambda jid: fetch_job_status(client, jid, headers), job_ids)
+        return dict(zip(job_ids, results))
+
+def update_job_status(job_id, status):
+    """Update a job's status in both session and persistent history"""
+    job = st.session_state.id_index.get(job_id)
+    if job is not None:
+        job['status'] = status
+    
+    # Update persistent history
+    if st.session_state.current_user_hash:
+        with get_db_lock(), get_db() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ? WHERE id = ? AND user_hash = ?",
+                (status, job_id, st.session_state.current_user_hash)
+            )
+
 def format_status(status):
     """Format status with colored badge"""
-    status_colors = {
-        "completed": "success",
-        "processing": "processing",
-        "failed": "failed"
-    }
-    css_class = status_colors.get(status.lower(), "processing")
-    return f'<span class="status-badge {css_class}">{status.upper()}</span>'
+    return _STATUS_HTML.get(status.lower()) or \
+        f'<span class="status-badge processing">{status.upper()}</span>'
 
 def save_job_to_history(job_data):
     """Save job to both session and persistent history"""
@@ -112,25 +263,42 @@ def save_job_to_history(job_data):
     }
     
     # Save to session history
-    st.session_state.job_history.insert(0, job_entry)
-    st.session_state.job_history = st.session_state.job_history[:20]
+    job_history = st.session_state.job_history
+    if len(job_history) == job_history.maxlen:
+        # The oldest job is about to fall off; drop it from the index too
+        st.session_state.id_index.pop(job_history[-1]["id"], None)
+    job_history.appendleft(job_entry)
+    st.session_state.id_index[job_entry["id"]] = job_entry
     
     # Save to persistent history
-    if st.session_state.current_user_hash:
-        if st.session_state.current_user_hash not in st.session_state.global_history:
-            st.session_state.global_history[st.session_state.current_user_hash] = []
-        
-        st.session_state.global_history[st.session_state.current_user_hash].insert(0, job_entry)
-        # Keep last 100 jobs per user
-        st.session_state.global_history[st.session_state.current_user_hash] = \
-            st.session_state.global_history[st.session_state.current_user_hash][:100]
+    user_hash = st.session_state.current_user_hash
+    if user_hash:
+        with get_db_lock(), get_db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, user_hash, title, company, submitted_at, status) "
+                "VALUES (:id, :user_hash, :title, :company, :submitted_at, :status)",
+                {**job_entry, "user_hash": user_hash}
+            )
+            # Keep last 100 jobs per user
+            conn.execute(
+                "DELETE FROM jobs WHERE user_hash = ? AND id NOT IN "
+                "(SELECT id FROM jobs WHERE user_hash = ? ORDER BY submitted_at DESC LIMIT ?)",
+                (user_hash, user_hash, USER_HISTORY_LEN)
+            )
 
 def load_user_history():
     """Load history for current user"""
-    if st.session_state.current_user_hash and \
-       st.session_state.current_user_hash in st.session_state.global_history:
-        st.session_state.job_history = \
-            st.session_state.global_history[st.session_state.current_user_hash].copy()
+    user_hash = st.session_state.current_user_hash
+    if user_hash:
+        with get_db_lock():
+            rows = get_db().execute(
+                "SELECT id, title, company, submitted_at, status FROM jobs "
+                "WHERE user_hash = ? ORDER BY submitted_at DESC LIMIT ?",
+                (user_hash, SESSION_HISTORY_LEN)
+            ).fetchall()
+        
+        st.session_state.job_history = deque((dict(row) for row in rows), maxlen=SESSION_HISTORY_LEN)
+        st.session_state.id_index = {job['id']: job for job in st.session_state.job_history}
 
 # Main App
 st.title("🎙️ INFLXD Transcription Service")
@@ -152,6 +320,8 @@ with st.sidebar:
                 st.session_state.api_token = api_key_input
                 st.session_state.current_user_hash = get_user_hash(api_key_input)
                 load_user_history()
+                st.session_state.last_status = None
+                st.session_state.last_status_token = None
                 st.success("✓ Authenticated successfully!")
                 st.rerun()
             else:
@@ -163,7 +333,10 @@ with st.sidebar:
         if st.button("Logout", use_container_width=True):
             st.session_state.api_token = None
             st.session_state.current_user_hash = None
-            st.session_state.job_history = []
+            st.session_state.job_history = deque(maxlen=SESSION_HISTORY_LEN)
+            st.session_state.id_index = {}
+            st.session_state.last_status = None
+            st.session_state.last_status_token = None
             st.rerun()
     
     # Recent Jobs History
@@ -172,14 +345,25 @@ with st.sidebar:
         st.header("📝 Recent Jobs")
         st.caption("Click on a job to see details and copy ID")
         
-        for i, job in enumerate(st.session_state.job_history[:5]):
+        if st.button("🔄 Refresh Statuses", use_container_width=True):
+            recent_ids = [job['id'] for job in islice(st.session_state.job_history, 5)]
+            with st.spinner("Refreshing job statuses..."):
+                statuses = refresh_all_statuses(recent_ids, st.session_state.api_token)
+            for jid, status_data in statuses.items():
+                if status_data:
+                    update_job_status(jid, status_data['status'])
+        
+        for i, job in enumerate(islice(st.session_state.job_history, 5)):
             with st.expander(f"🔸 {job['title'][:25]}..." if len(job['title']) > 25 else f"🔸 {job['title']}", expanded=False):
-                st.markdown(f"**Company:** {job['company']}")
-                st.markdown(f"**Status:** {job['status']}")
-                st.markdown(f"**Submitted:** {job['submitted_at']}")
-                st.divider()
-                st.markdown("**📋 Job ID** *(click below to select and copy)*")
-                st.code(job['id'], language=None)
+                # One markdown element instead of six separate widgets
+                st.markdown(
+                    f"**Company:** {job['company']}  \n"
+                    f"**Status:** {job['status']}  \n"
+                    f"**Submitted:** {job['submitted_at']}\n\n"
+                    "---\n\n"
+                    "**📋 Job ID** *(click below to select and copy)*\n"
+                    f"```\n{job['id']}\n```"
+                )
 
 # Check if authenticated
 if st.session_state.api_token is None:
@@ -264,6 +448,9 @@ with tab1:
         elif not company:
             st.error("Please enter a company name")
         else:
+            import orjson
+            from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+            
             with st.spinner("Uploading audio file and creating transcription job..."):
                 # Prepare request
                 headers = {
@@ -288,22 +475,27 @@ with tab1:
                     data["time_period"] = time_period
                 if speakers:
                     try:
-                        speakers_json = json.loads(speakers)
-                        data["speakers"] = json.dumps(speakers_json)
-                    except:
+                        speakers_json = orjson.loads(speakers)
+                        data["speakers"] = orjson.dumps(speakers_json).decode()
+                    except orjson.JSONDecodeError:
                         st.warning("Invalid speakers JSON format, skipping...")
                 
                 # Get appropriate MIME type
                 mime_type = get_mime_type(uploaded_file.name)
                 
-                files = {
-                    "audio": (uploaded_file.name, uploaded_file.getvalue(), mime_type)
-                }
+                # Encode the multipart body lazily as the socket drains
+                uploaded_file.seek(0)
+                encoder = MultipartEncoder(
+                    fields={**data, "audio": (uploaded_file.name, uploaded_file, mime_type)}
+                )
+                progress_bar = st.progress(0, text="Uploading...")
+                monitor = MultipartEncoderMonitor(encoder, make_upload_progress(progress_bar, encoder.len))
+                headers["Content-Type"] = monitor.content_type
                 
                 # Make request
-                response = make_api_request("POST", "/workflow", headers=headers, data=data, files=files)
+                response = make_api_request("POST", "/workflow", headers=headers, data=monitor)
                 
-                if response and response.status_code in (200, 201):
+                if response is not None and response.status_code in (200, 201):
                     job_data = response.json()
                     save_job_to_history(job_data)
                     
@@ -326,7 +518,7 @@ with tab1:
                     st.code(job_data['id'], language=None)
                     st.caption("Job ID copied to clipboard! Use this to check status.")
                 
-                elif response:
+                elif response is not None:
                     st.error(f"Error {response.status_code}: {response.text}")
                 else:
                     st.error("Failed to connect to the API")
@@ -353,66 +545,73 @@ with tab2:
     with col2:
         auto_refresh = st.checkbox("Auto-refresh", value=False)
     
-    if st.button("🔍 Check Status", type="primary", use_container_width=True) or auto_refresh:
-        if job_id:
+    @st.fragment(run_every=5 if auto_refresh else None)
+    def job_status_fragment(job_id):
+        """Fetch and display a job's status; reruns on its own while auto-refresh is on"""
+        status_data = st.session_state.last_status
+        if st.session_state.last_status_token != st.session_state.api_token:
+            # Never reuse a result fetched with someone else's credentials
+            status_data = None
+        
+        # Only hit the API while the job can still change; failures are final until the next check
+        if status_data is None or status_data['id'] != job_id or status_data['status'] == 'processing':
             with st.spinner("Checking job status..."):
                 headers = {
                     "Authorization": f"Bearer {st.session_state.api_token}"
                 }
                 
                 response = make_api_request("GET", f"/workflow/{job_id}", headers=headers)
+            
+            if response is not None and response.status_code == 200:
+                status_data = response.json()
                 
-                if response and response.status_code == 200:
-                    status_data = response.json()
-                    
-                    # Update status in both session and persistent history
-                    for job in st.session_state.job_history:
-                        if job['id'] == job_id:
-                            job['status'] = status_data['status']
-                            break
-                    
-                    # Update persistent history
-                    if st.session_state.current_user_hash and \
-                       st.session_state.current_user_hash in st.session_state.global_history:
-                        for job in st.session_state.global_history[st.session_state.current_user_hash]:
-                            if job['id'] == job_id:
-                                job['status'] = status_data['status']
-                                break
-                    
-                    # Display status
-                    st.markdown(f"### Status: {format_status(status_data['status'])}", unsafe_allow_html=True)
-                    
-                    # Progress indicator
-                    if status_data['status'] == 'processing':
-                        st.progress(0.5, text="Transcription in progress...")
-                    elif status_data['status'] == 'completed':
-                        st.progress(1.0, text="Transcription completed!")
-                    
-                    # Job details
-                    with st.expander("Full Job Details", expanded=True):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.text(f"Job ID: {status_data['id']}")
-                            st.text(f"Title: {status_data['title']}")
-                            st.text(f"Company: {status_data['company']}")
-                            st.text(f"Status: {status_data['status']}")
-                        
-                        with col2:
-                            st.text(f"Upload Type: {status_data.get('upload_type', 'N/A')}")
-                            st.text(f"Entities: {status_data.get('entities', 'N/A')}")
-                            if status_data.get('public_url'):
-                                st.markdown(f"[📎 Audio File]({status_data['public_url']})")
-                    
-                    # Auto-refresh logic
-                    if auto_refresh and status_data['status'] == 'processing':
-                        time.sleep(5)
-                        st.rerun()
-                
-                elif response:
-                    st.error(f"Error {response.status_code}: {response.text}")
-                else:
-                    st.error("Failed to connect to the API")
+                # Update status in both session and persistent history
+                update_job_status(job_id, status_data['status'])
+            elif response is not None:
+                status_data = {"id": job_id, "status": None, "error": f"Error {response.status_code}: {response.text}"}
+            else:
+                status_data = {"id": job_id, "status": None, "error": "Failed to connect to the API"}
+            
+            st.session_state.last_status = status_data
+            st.session_state.last_status_token = st.session_state.api_token
+        
+        if status_data.get('error'):
+            st.error(status_data['error'])
+            return
+        
+        # Display status
+        st.markdown(f"### Status: {format_status(status_data['status'])}", unsafe_allow_html=True)
+        
+        # Progress indicator
+        if status_data['status'] == 'processing':
+            st.progress(0.5, text="Transcription in progress...")
+        elif status_data['status'] == 'completed':
+            st.progress(1.0, text="Transcription completed!")
+        
+        # Job details
+        with st.expander("Full Job Details", expanded=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.text(f"Job ID: {status_data['id']}")
+                st.text(f"Title: {status_data['title']}")
+                st.text(f"Company: {status_data['company']}")
+                st.text(f"Status: {status_data['status']}")
+            
+            with col2:
+                st.text(f"Upload Type: {status_data.get('upload_type', 'N/A')}")
+                st.text(f"Entities: {status_data.get('entities', 'N/A')}")
+                if status_data.get('public_url'):
+                    st.markdown(f"[📎 Audio File]({status_data['public_url']})")
+    
+    check_clicked = st.button("🔍 Check Status", type="primary", use_container_width=True)
+    if check_clicked:
+        # An explicit check always goes to the API
+        st.session_state.last_status = None
+    
+    if check_clicked or auto_refresh:
+        if job_id:
+            job_status_fragment(job_id)
         else:
             st.warning("Please enter a job ID")
 
@@ -453,58 +652,62 @@ with tab3:
     
     if st.button("📥 Download Transcript", type="primary", use_container_width=True):
         if download_job_id:
+            import orjson
+            import requests
+            
             with st.spinner(f"Downloading transcript in {format_type.upper()} format..."):
-                headers = {
-                    "Authorization": f"Bearer {st.session_state.api_token}"
+                # Build export options
+                flags = {
+                    "remove_timestamps": remove_timestamps,
+                    "remove_word_timestamps": remove_word_timestamps,
+                    "remove_speaker_labels": remove_speaker_labels,
+                    "remove_insights": remove_insights,
+                    "remove_keywords": remove_keywords
                 }
+                options = tuple(flag for flag, checkbox in _EXPORT_FLAGS if flags[checkbox])
                 
-                # Build query parameters
-                params = []
-                if remove_timestamps:
-                    params.append("remove_timestamps=1")
-                if remove_word_timestamps:
-                    params.append("remove_word_level_timestamps=1")
-                if remove_speaker_labels:
-                    params.append("remove_speaker_labels=1")
-                if remove_insights:
-                    params.append("remove_insights=1")
-                if remove_keywords:
-                    params.append("remove_keywords=1")
-                
-                query_string = "?" + "&".join(params) if params else ""
-                endpoint = f"/transcript/export/{download_job_id}/{format_type}{query_string}"
-                
-                response = make_api_request("GET", endpoint, headers=headers)
+                try:
+                    content = fetch_export(
+                        st.session_state.api_token, download_job_id, format_type, options
+                    )
+                except requests.HTTPError as e:
+                    content = None
+                    if e.response.status_code == 404:
+                        st.error("Transcript not found. Make sure the job is completed.")
+                    else:
+                        st.error(f"Error {e.response.status_code}: {e.response.text}")
+                except requests.RequestException as e:
+                    content = None
+                    st.error(f"API Request Error: {str(e)}")
+                    st.error("Failed to connect to the API")
                 
-                if response and response.status_code == 200:
+                if content is not None:
                     # Prepare download
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     filename = f"transcript_{download_job_id[:8]}_{timestamp}.{format_type}"
+                    preview = content[:PREVIEW_BYTES].decode("utf-8", errors="replace")
                     
                     # Handle different content types
                     if format_type == "json":
-                        content = response.text
                         mime_type = "application/json"
                         
                         # Display JSON preview
                         with st.expander("Preview JSON Transcript", expanded=True):
                             try:
-                                json_data = json.loads(content)
+                                json_data = orjson.loads(content)
                                 st.json(json_data)
-                            except:
-                                st.text(content[:1000] + "...")
+                            except orjson.JSONDecodeError:
+                                st.text(preview[:1000] + "...")
                     
                     elif format_type in ["pdf", "docx"]:
-                        content = response.content
                         mime_type = "application/octet-stream"
                     
                     else:  # txt, html, srt, vtt
-                        content = response.text
                         mime_type = "text/plain"
                         
                         # Display text preview
                         with st.expander(f"Preview {format_type.upper()} Transcript", expanded=True):
-                            st.text(content[:1000] + "...")
+                            st.text(preview[:1000] + "...")
                     
                     # Download button
                     st.download_button(
@@ -516,14 +719,6 @@ with tab3:
                     )
                     
                     st.success(f"✅ Transcript ready for download as {filename}")
-                
-                elif response:
-                    if response.status_code == 404:
-                        st.error("Transcript not found. Make sure the job is completed.")
-                    else:
-                        st.error(f"Error {response.status_code}: {response.text}")
-                else:
-                    st.error("Failed to connect to the API")
         else:
             st.warning("Please enter a job ID")
 